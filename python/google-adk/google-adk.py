@@ -8,16 +8,24 @@ can manage Xero accounting operations using MCP tools.
 """
 
 import os
+import sys
+import shutil
 import asyncio
-from typing import List, Dict, Any, Optional, Union
+import traceback
+from typing import AsyncIterator, List, Dict, Any, Optional, Sequence, Tuple, Union
 from dotenv import load_dotenv
-from google.adk.agents import LlmAgent
-from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
-from google.adk.artifacts.in_memory_artifact_service import InMemoryArtifactService
-from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
-from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset, StdioServerParameters
-from google.genai import types
+
+try:
+    from google.adk.agents import LlmAgent
+    from google.adk.runners import Runner
+    from google.adk.sessions import InMemorySessionService
+    from google.adk.artifacts.in_memory_artifact_service import InMemoryArtifactService
+    from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
+    from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset, StdioServerParameters
+    from google.genai import types
+except ImportError:
+    print("❌ Google ADK is not installed. Please install with: pip install google-adk")
+    sys.exit(1)
 
 # Load environment variables
 load_dotenv()
@@ -25,36 +33,244 @@ load_dotenv()
 # MCP Server Configuration
 TS_MCP_SERVER_COMMAND = "@xeroapi/xero-mcp-server@latest"
 
-def create_xero_mcp_toolset() -> MCPToolset:
-    """Create the Xero MCP toolset for ADK integration."""
-    return MCPToolset(
-        connection_params=StdioServerParameters(
-            command="npx",
-            args=[TS_MCP_SERVER_COMMAND],
-            env_vars={
-                "XERO_CLIENT_ID": os.getenv("XERO_CLIENT_ID"),
-                "XERO_CLIENT_SECRET": os.getenv("XERO_CLIENT_SECRET"),
-            },
-        ),
-        # Include comprehensive tool set for all demos
-        tool_filter=[
-            "list-contacts",
-            "create-contact", 
-            "list-invoices",
-            "create-invoice",
-            "get-timesheet",
-            "list-accounts",
-            "list-items",
-            "list-tax-rates",
-            "list-tracking-categories",
-            "update-contact",
-            "update-invoice",
-            "create-payment",
-            "list-payments",
-            "list-organisation-details"
-        ]
+# Absolute path to npx, resolved once so the server spawn skips the PATH search
+NPX_PATH = shutil.which("npx")
+
+# Include comprehensive tool set for all demos
+XERO_TOOL_FILTER = (
+    "list-contacts",
+    "create-contact",
+    "list-invoices",
+    "create-invoice",
+    "get-timesheet",
+    "list-accounts",
+    "list-items",
+    "list-tax-rates",
+    "list-tracking-categories",
+    "update-contact",
+    "update-invoice",
+    "create-payment",
+    "list-payments",
+    "list-organisation-details",
+)
+
+# Environment snapshot, resolved once after .env has been loaded
+XERO_ENV_VARS = {
+    "XERO_CLIENT_ID": os.environ.get("XERO_CLIENT_ID"),
+    "XERO_CLIENT_SECRET": os.environ.get("XERO_CLIENT_SECRET"),
+}
+DEFAULT_MODEL = os.environ.get("DEFAULT_MODEL", "gemini-2.0-flash")
+
+# Run the independent queries of a demo at the same time (python google-adk.py --concurrent)
+CONCURRENT_QUERIES = "--concurrent" in sys.argv[1:]
+
+# Reply used when the agent finishes without producing any text
+EMPTY_RESPONSE = "I'm ready to help with Xero operations!"
+
+# Seconds to wait for an MCP toolset to shut down
+MCP_CONNECTION_TIMEOUT = 10
+
+# Name of the coroutine that closes an MCPToolset in the installed ADK version
+MCP_CLOSE_ATTR = next(
+    (name for name in ("aclose", "close", "disconnect", "cleanup") if hasattr(MCPToolset, name)),
+    None,
+)
+
+class _ToolsetOwner:
+    """
+    Run one MCP toolset's connection on a single owner task.
+
+    The MCP client uses anyio cancel scopes, which must be entered and
+    exited on the same task. The owner task connects the toolset, waits
+    for shutdown and then closes it, so both ends always run on one task
+    no matter which task the agent is used from.
+    """
+
+    def __init__(self, toolset: MCPToolset):
+        self.toolset = toolset
+        self.refcount = 0
+        self._ready = None
+        self._shutdown = asyncio.Event()
+        self._task = None
+
+    def start(self):
+        """Start the owner task if it is not already running."""
+        if self._task is None:
+            self._ready = asyncio.get_running_loop().create_future()
+            self._task = asyncio.create_task(self._run())
+
+    def _connect_failed(self) -> bool:
+        """Return True if the last attempt to connect raised an error."""
+        ready = self._ready
+        return ready is not None and ready.done() and not ready.cancelled() and ready.exception() is not None
+
+    async def wait_until_ready(self):
+        """
+        Wait until the toolset has connected, raising if it failed to.
+
+        If the last attempt to connect failed, the connection is retried.
+        """
+        if self._connect_failed() and not self._shutdown.is_set():
+            task = self._task
+            # Let the failed attempt finish closing before reconnecting
+            await asyncio.gather(task, return_exceptions=True)
+            if self._task is task:
+                self._task = None
+                self.start()
+        if self._ready is not None:
+            # Shield so a cancelled caller does not cancel other waiters
+            await asyncio.shield(self._ready)
+
+    async def close(self):
+        """Signal the owner task to close the toolset and wait for it."""
+        if self._task is None:
+            return
+        self._shutdown.set()
+        if not self._ready.done():
+            self._task.cancel()
+        try:
+            # On timeout the owner task is cancelled, which still unwinds
+            # the MCP connection on that task
+            await asyncio.wait_for(
+                asyncio.gather(self._task, return_exceptions=True),
+                timeout=MCP_CONNECTION_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            print("⚠️ Warning: timed out closing MCP toolset")
+
+    async def _run(self):
+        try:
+            await self.toolset.get_tools()
+            self._ready.set_result(None)
+            await self._shutdown.wait()
+        except Exception as e:
+            if not self._ready.done():
+                self._ready.set_exception(e)
+        finally:
+            if not self._ready.done():
+                self._ready.cancel()
+            await self._close_toolset()
+
+    async def _close_toolset(self):
+        if MCP_CLOSE_ATTR is None:
+            return
+        try:
+            # Awaited directly: wait_for would run the close on another task
+            await getattr(self.toolset, MCP_CLOSE_ATTR)()
+            print("✅ MCP toolset closed")
+        except Exception as e:
+            print(f"⚠️ Warning while closing MCP toolset: {e!r}")
+
+
+class McpToolsetPool:
+    """
+    Share MCP toolsets between agents so each server is spawned once.
+
+    Toolsets are keyed on the server command, args, environment and tool
+    filter, and start connecting in the background as soon as they are
+    first acquired. Every acquire() must be paired with a release(); a
+    toolset is closed when its last reference is released, unless the
+    pool is being used as an async context manager, in which case idle
+    toolsets are kept running until the pool exits.
+    """
+
+    def __init__(self):
+        self._owners: Dict[tuple, _ToolsetOwner] = {}
+        self._held = False
+
+    def acquire(
+        self,
+        command: str,
+        args: List[str],
+        env_vars: Dict[str, Optional[str]],
+        tool_filter: Optional[Sequence[str]] = None,
+    ) -> Tuple[tuple, MCPToolset]:
+        """Return a (key, toolset) pair, creating the toolset on first use."""
+        key = (command, tuple(args), frozenset(env_vars.items()), tuple(tool_filter or ()))
+        owner = self._owners.get(key)
+        if owner is None:
+            owner = _ToolsetOwner(
+                MCPToolset(
+                    connection_params=StdioServerParameters(
+                        command=command,
+                        args=list(args),
+                        env_vars=dict(env_vars),
+                    ),
+                    tool_filter=list(tool_filter) if tool_filter else None,
+                )
+            )
+            self._owners[key] = owner
+        owner.refcount += 1
+        owner.start()
+        return key, owner.toolset
+
+    async def wait_until_ready(self, key: tuple):
+        """Wait for the toolset for key to finish connecting."""
+        await self._owners[key].wait_until_ready()
+
+    async def release(self, key: tuple):
+        """Drop a reference to a toolset, closing it once it is unused."""
+        owner = self._owners[key]
+        owner.refcount -= 1
+        if owner.refcount == 0 and not self._held:
+            await self._close(key)
+
+    async def _close(self, key: tuple):
+        """Close the toolset for key and remove it from the pool."""
+        await self._owners.pop(key).close()
+
+    async def __aenter__(self):
+        """Keep idle toolsets running until the pool exits."""
+        self._held = True
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close every toolset that is no longer referenced."""
+        self._held = False
+        for key, owner in list(self._owners.items()):
+            if owner.refcount == 0:
+                await self._close(key)
+
+
+def create_xero_mcp_toolset(pool: McpToolsetPool) -> Tuple[tuple, MCPToolset]:
+    """Acquire the Xero MCP toolset for ADK integration from the pool."""
+    return pool.acquire(
+        command=NPX_PATH or "npx",
+        args=[TS_MCP_SERVER_COMMAND],
+        env_vars=XERO_ENV_VARS,
+        tool_filter=XERO_TOOL_FILTER,
     )
 
+
+def _make_user_content(query: str) -> types.Content:
+    """
+    Wrap a user query in the Content message the runner expects.
+
+    A fresh Content is built per query on purpose: the session service
+    stores the message object in its event history, so reusing and
+    mutating a shared template would rewrite earlier turns.
+    """
+    return types.Content(role='user', parts=[types.Part(text=query)])
+
+
+def _handle_text_part(text: str) -> Optional[str]:
+    """Pass text parts straight through to the caller."""
+    return text
+
+
+def _handle_function_call_part(function_call: Any) -> Optional[str]:
+    """Log function calls, which ADK executes automatically."""
+    name = getattr(function_call, 'name', None)
+    print(f"🔧 Function call: {name or '[unnamed]'}")
+    return None
+
+
+# Part fields to act on, checked in order; handlers return text to yield
+_PART_HANDLERS = (
+    ('text', _handle_text_part),
+    ('function_call', _handle_function_call_part),
+)
+
 # =============================================================================
 # XeroADKAgent Class - Uses MCP Server for Xero operations
 # =============================================================================
@@ -67,24 +283,28 @@ class XeroADKAgent:
     agent framework using the Xero MCP Server.
     """
     
-    def __init__(self):
+    def __init__(self, pool: Optional[McpToolsetPool] = None):
         """Initialize the ADK agent with Xero MCP tools."""
+        self.pool = pool or McpToolsetPool()
         self.agent = None
         self.runner = None
         self.session_service = None
         self.session = None
         self.xero_toolset = None
+        self._toolset_key = None
+        self._initialized = False
         
     async def initialize(self):
         """Initialize the agent and services asynchronously."""
         try:
-            # Create the Xero MCP toolset and store reference for cleanup
-            self.xero_toolset = create_xero_mcp_toolset()
+            # Acquire the shared Xero MCP toolset and keep its key for release.
+            # The pool starts the MCP server now rather than on the first prompt.
+            self._toolset_key, self.xero_toolset = create_xero_mcp_toolset(self.pool)
             
             # Create the ADK agent with MCP tools
             self.agent = LlmAgent(
                 name="xero_mcp_agent",
-                model=os.getenv("DEFAULT_MODEL", "gemini-2.0-flash"),
+                model=DEFAULT_MODEL,
                 description="Xero Accounting Agent using MCP Server",
                 instruction="""
                 You are an intelligent Xero accounting agent with direct access to Xero's API through MCP tools.
@@ -128,12 +348,9 @@ class XeroADKAgent:
             )
             
             # Create session
-            self.session = await self.session_service.create_session(
-                state={}, 
-                app_name="xero_mcp_agent", 
-                user_id="demo_user"
-            )
+            self.session = await self._create_session()
             
+            self._initialized = True
             print("✅ ADK agent initialized successfully")
             
         except Exception as e:
@@ -141,32 +358,16 @@ class XeroADKAgent:
             raise
     
     async def cleanup(self):
-        """Clean up resources and close MCP connections."""
+        """Clean up resources and release the shared MCP toolset."""
+        self._initialized = False
         try:
-            if self.xero_toolset:
-                # Try different cleanup methods for the MCP toolset
-                cleanup_methods = [
-                    ('close', lambda: self.xero_toolset.close()),
-                    ('disconnect', lambda: self.xero_toolset.disconnect()),
-                    ('cleanup', lambda: self.xero_toolset.cleanup()),
-                    ('_client.close', lambda: self.xero_toolset._client.close() if hasattr(self.xero_toolset, '_client') else None),
-                    ('_connection.close', lambda: self.xero_toolset._connection.close() if hasattr(self.xero_toolset, '_connection') else None)
-                ]
-                
-                for method_name, method_call in cleanup_methods:
-                    try:
-                        if hasattr(self.xero_toolset, method_name.split('.')[0]):
-                            result = method_call()
-                            if result and hasattr(result, '__await__'):
-                                await result
-                            print(f"✅ Used {method_name} for cleanup")
-                            break
-                    except Exception as cleanup_error:
-                        continue  # Try next method
-                        
-            # Force garbage collection to help with cleanup
-            import gc
-            gc.collect()
+            if self._toolset_key is not None:
+                key, self._toolset_key = self._toolset_key, None
+                await self.pool.release(key)
+            # Drop references so the agent and runner can be collected normally
+            self.xero_toolset = None
+            self.agent = None
+            self.runner = None
             print("✅ Agent cleanup completed")
         except Exception as e:
             print(f"⚠️ Warning during cleanup: {e}")
@@ -181,59 +382,83 @@ class XeroADKAgent:
         """Async context manager exit with cleanup."""
         await self.cleanup()
     
-    async def process(self, query: str) -> str:
+    async def _create_session(self):
+        """Create a new conversation session for the demo user."""
+        return await self.session_service.create_session(
+            state={}, 
+            app_name="xero_mcp_agent", 
+            user_id="demo_user"
+        )
+    
+    def _check_initialized(self):
+        """Fail fast rather than silently respawning the MCP server."""
+        if not self._initialized:
+            raise RuntimeError("Agent not initialized; use 'async with XeroADKAgent()'")
+    
+    async def wait_until_ready(self):
+        """Wait for the background MCP server connection to finish."""
+        if self._toolset_key is not None:
+            await self.pool.wait_until_ready(self._toolset_key)
+    
+    async def process_stream(self, query: str, session: Any = None) -> AsyncIterator[str]:
+        """
+        Process a user query, yielding each text part as the agent produces it.
+        """
+        self._check_initialized()
+        await self.wait_until_ready()
+        session = session or self.session
+            
+        print(f"\n🤖 Processing: {query}")
+        
+        # Run the agent
+        events_async = self.runner.run_async(
+            session_id=session.id,
+            user_id=session.user_id,
+            new_message=_make_user_content(query)
+        )
+        
+        async for event in events_async:
+            parts = getattr(getattr(event, 'content', None), 'parts', None)
+            if not parts:
+                continue
+            for part in parts:
+                for field, handler in _PART_HANDLERS:
+                    value = getattr(part, field, None)
+                    if value:
+                        text = handler(value)
+                        if text:
+                            yield text
+                        break
+    
+    async def process(self, query: str, session: Any = None) -> str:
         """
         Process a user query using the ADK agent.
         """
+        self._check_initialized()
         try:
-            if not self.agent or not self.runner:
-                await self.initialize()
-                
-            print(f"\n🤖 Processing: {query}")
-            
-            # Create content for the query
-            content = types.Content(
-                role='user', 
-                parts=[types.Part(text=query)]
-            )
-            
-            # Run the agent
-            response_parts = []
-            events_async = self.runner.run_async(
-                session_id=self.session.id,
-                user_id=self.session.user_id,
-                new_message=content
-            )
-            
-            async for event in events_async:
-                try:
-                    if hasattr(event, 'content') and hasattr(event.content, 'parts'):
-                        for part in event.content.parts:
-                            # Handle text parts
-                            if hasattr(part, 'text') and part.text:
-                                response_parts.append(part.text)
-                            # Handle function call parts (if any)
-                            elif hasattr(part, 'function_call') and part.function_call is not None:
-                                # Function calls are usually handled automatically by ADK
-                                # but we can log them for debugging
-                                if hasattr(part.function_call, 'name') and part.function_call.name:
-                                    print(f"🔧 Function call: {part.function_call.name}")
-                                else:
-                                    print("🔧 Function call: [unnamed]")
-                except Exception as part_error:
-                    print(f"⚠️ Error processing response part: {part_error}")
-                    continue
-            
-            result = ' '.join(response_parts) if response_parts else "I'm ready to help with Xero operations!"
-            return result
+            response_parts = [part async for part in self.process_stream(query, session)]
+            return ' '.join(response_parts) if response_parts else EMPTY_RESPONSE
             
         except Exception as e:
             error_msg = f"Error processing query '{query}': {str(e)}"
             print(f"❌ {error_msg}")
             return error_msg
+    
+    async def process_many(self, queries: List[str]) -> List[str]:
+        """
+        Process independent queries concurrently, returning results in order.
+        
+        Each query runs in its own session so the conversations do not
+        interleave in one history.
+        """
+        self._check_initialized()
+        sessions = await asyncio.gather(*(self._create_session() for _ in queries))
+        return await asyncio.gather(
+            *(self.process(query, session) for query, session in zip(queries, sessions))
+        )
 
 
-async def demo_basic_operations():
+async def demo_basic_operations(pool: Optional[McpToolsetPool] = None):
     """Demonstrate basic Xero operations with real ADK and MCP."""
     print("\n" + "="*50)
     print("BASIC XERO OPERATIONS WITH ADK + MCP SERVER")
@@ -246,7 +471,13 @@ async def demo_basic_operations():
         "Show me recent invoices"
     ]
     
-    async with XeroADKAgent() as agent:
+    async with XeroADKAgent(pool) as agent:
+        if CONCURRENT_QUERIES:
+            for query, result in zip(queries, await agent.process_many(queries)):
+                print(f"\n📝 Query: {query}")
+                print(f"✅ Result: {result}")
+            return
+        
         for query in queries:
             print(f"\n📝 Query: {query}")
             try:
@@ -256,14 +487,13 @@ async def demo_basic_operations():
                 print(f"❌ Error processing '{query}': {e}")
                 print(f"   Error type: {type(e).__name__}")
                 # Try to get more details about the error
-                import traceback
                 print(f"   Traceback: {traceback.format_exc()}")
                 
                 # Continue with other queries
                 continue
 
 
-async def demo_invoice_workflow():
+async def demo_invoice_workflow(pool: Optional[McpToolsetPool] = None):
     """Demonstrate a complete invoice workflow with real ADK and MCP."""
     print("\n" + "="*50)
     print("INVOICE WORKFLOW WITH ADK + MCP SERVER")
@@ -276,7 +506,7 @@ async def demo_invoice_workflow():
         "Create an invoice for Demo Company Inc for 'ADK Integration Services' worth $750"
     ]
     
-    async with XeroADKAgent() as agent:
+    async with XeroADKAgent(pool) as agent:
         for i, query in enumerate(workflow_queries, 1):
             print(f"\n📌 Step {i}: {query}")
             try:
@@ -286,7 +516,7 @@ async def demo_invoice_workflow():
                 print(f"❌ Error: {e}")
 
 
-async def demo_natural_language_processing():
+async def demo_natural_language_processing(pool: Optional[McpToolsetPool] = None):
     """Demonstrate natural language understanding with real ADK and MCP."""
     print("\n" + "="*50)
     print("NATURAL LANGUAGE PROCESSING WITH ADK + MCP SERVER")
@@ -300,7 +530,13 @@ async def demo_natural_language_processing():
         "Create a new supplier called TechSupport Ltd with email support@techsupport.com"
     ]
     
-    async with XeroADKAgent() as agent:
+    async with XeroADKAgent(pool) as agent:
+        if CONCURRENT_QUERIES:
+            for query, result in zip(nl_queries, await agent.process_many(nl_queries)):
+                print(f"\n💬 Query: '{query}'")
+                print(f"🤖 Agent: {result}")
+            return
+        
         for query in nl_queries:
             print(f"\n💬 Query: '{query}'")
             try:
@@ -310,7 +546,7 @@ async def demo_natural_language_processing():
                 print(f"❌ Error: {e}")
 
 
-async def demo_error_handling():
+async def demo_error_handling(pool: Optional[McpToolsetPool] = None):
     """Demonstrate error handling in ADK + MCP integration."""
     print("\n" + "="*50)
     print("ERROR HANDLING IN ADK + MCP SERVER")
@@ -323,7 +559,13 @@ async def demo_error_handling():
         "List invoices with invalid status 'IMAGINARY'"
     ]
     
-    async with XeroADKAgent() as agent:
+    async with XeroADKAgent(pool) as agent:
+        if CONCURRENT_QUERIES:
+            for scenario, result in zip(error_scenarios, await agent.process_many(error_scenarios)):
+                print(f"\n🧪 Testing: {scenario}")
+                print(f"✅ Handled gracefully: {result}")
+            return
+        
         for scenario in error_scenarios:
             print(f"\n🧪 Testing: {scenario}")
             try:
@@ -333,7 +575,7 @@ async def demo_error_handling():
                 print(f"⚠️ Exception caught: {e}")
 
 
-async def demo_batch_operations():
+async def demo_batch_operations(pool: Optional[McpToolsetPool] = None):
     """Demonstrate batch operations with real ADK and MCP."""
     print("\n" + "="*50)
     print("BATCH OPERATIONS WITH ADK + MCP SERVER")
@@ -349,7 +591,7 @@ async def demo_batch_operations():
     Provide a summary of what you found.
     """
     
-    async with XeroADKAgent() as agent:
+    async with XeroADKAgent(pool) as agent:
         print(f"\n📋 Batch Query: {batch_query}")
         try:
             result = await agent.process(batch_query)
@@ -358,7 +600,7 @@ async def demo_batch_operations():
             print(f"❌ Error: {e}")
 
 
-async def interactive_demo():
+async def interactive_demo(pool: Optional[McpToolsetPool] = None):
     """Run an interactive demo with real ADK agent."""
     print("\n" + "="*50)
     print("INTERACTIVE ADK XERO AGENT")
@@ -371,7 +613,10 @@ async def interactive_demo():
     print("- Manage payments and other accounting operations")
     print("\nType 'quit' to exit.\n")
     
-    async with XeroADKAgent() as agent:
+    async with XeroADKAgent(pool) as agent:
+        print("Connecting to Xero...")
+        await agent.wait_until_ready()
+        
         while True:
             try:
                 user_input = input("\n👤 You: ").strip()
@@ -383,8 +628,15 @@ async def interactive_demo():
                 if not user_input:
                     continue
                 
-                result = await agent.process(user_input)
-                print(f"\n🤖 Agent: {result}")
+                # Print the reply as it streams in rather than all at the end
+                streamed = False
+                async for chunk in agent.process_stream(user_input):
+                    print((" " if streamed else "\n🤖 Agent: ") + chunk, end="", flush=True)
+                    streamed = True
+                if streamed:
+                    print()
+                else:
+                    print(f"\n🤖 Agent: {EMPTY_RESPONSE}")
                 
             except KeyboardInterrupt:
                 print("\n\nGoodbye!")
@@ -393,19 +645,21 @@ async def interactive_demo():
                 print(f"\n❌ Error: {e}")
 
 
+# Demos in menu order
+DEMOS = (
+    demo_basic_operations,
+    demo_invoice_workflow,
+    demo_natural_language_processing,
+    demo_error_handling,
+    demo_batch_operations,
+    interactive_demo,
+)
+
+
 async def main():
     """Run the ADK integration examples."""
-    # Check for required dependencies
-    try:
-        import google.adk
-        print("✅ Google ADK is installed")
-    except ImportError:
-        print("❌ Google ADK is not installed. Please install with: pip install google-adk")
-        return
-    
     # Check for Xero credentials (MCP server only needs CLIENT_ID and CLIENT_SECRET)
-    required_env_vars = ["XERO_CLIENT_ID", "XERO_CLIENT_SECRET"]
-    missing_vars = [var for var in required_env_vars if not os.getenv(var)]
+    missing_vars = [var for var, value in XERO_ENV_VARS.items() if not value]
     
     if missing_vars:
         print("❌ Error: Missing required environment variables:")
@@ -426,8 +680,7 @@ async def main():
         return
     
     # Check for npx (required for MCP server)
-    import shutil
-    if not shutil.which("npx"):
+    if not NPX_PATH:
         print("❌ Error: npx is not installed")
         print("Please install Node.js and npm to get npx")
         print("Visit: https://nodejs.org/")
@@ -438,35 +691,41 @@ async def main():
     print("Google ADK implementation with Xero MCP Server")
     print("Powered by Xero MCP Server tools\n")
     
-    print("Select a demo:")
-    print("1. Basic Operations") 
-    print("2. Invoice Workflow")
-    print("3. Natural Language Processing")
-    print("4. Error Handling")
-    print("5. Batch Operations")
-    print("6. Interactive Demo")
-    
-    choice = input("\nEnter your choice (1-6): ").strip()
-    
-    demos = {
-        "1": demo_basic_operations,
-        "2": demo_invoice_workflow, 
-        "3": demo_natural_language_processing,
-        "4": demo_error_handling,
-        "5": demo_batch_operations,
-        "6": interactive_demo
-    }
-    
-    if choice in demos:
-        try:
-            await demos[choice]()
-        except KeyboardInterrupt:
-            print("\n\nDemo interrupted by user.")
-        except Exception as e:
-            print(f"\n❌ Demo failed: {e}")
-            print("Please check your environment configuration and try again.")
-    else:
-        print("Invalid choice. Please run again and select 1-6.")
+    # Share one MCP server subprocess across every agent and every demo run
+    async with McpToolsetPool() as pool:
+        while True:
+            print("Select a demo:")
+            print("1. Basic Operations") 
+            print("2. Invoice Workflow")
+            print("3. Natural Language Processing")
+            print("4. Error Handling")
+            print("5. Batch Operations")
+            print("6. Interactive Demo")
+            
+            try:
+                choice = input("\nEnter your choice (1-6): ").strip()
+            except EOFError:
+                break
+            index = int(choice) - 1 if choice.isdecimal() else -1
+            
+            if 0 <= index < len(DEMOS):
+                try:
+                    await DEMOS[index](pool)
+                except KeyboardInterrupt:
+                    print("\n\nDemo interrupted by user.")
+                except Exception as e:
+                    print(f"\n❌ Demo failed: {e}")
+                    print("Please check your environment configuration and try again.")
+            else:
+                print("Invalid choice. Please select 1-6.")
+            
+            try:
+                again = input("\nRun another demo? (y/n): ").strip().lower()
+            except EOFError:
+                break
+            if again not in ("y", "yes"):
+                break
+            print()
 
 
 if __name__ == "__main__":
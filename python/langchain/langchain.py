@@ -9,26 +9,76 @@ and various integration patterns using the langchain-mcp-adapters library.
 
 import os
 import asyncio
+import importlib.util
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-# Standard LangChain imports
-try:
-    from langchain_openai import ChatOpenAI
-    from langgraph.prebuilt import create_react_agent
-    from langchain_core.messages import HumanMessage
-except ImportError:
-    print("Please install langchain: pip install langchain langchain-openai langgraph")
+# Check dependencies without importing them, mapped to their pip package names
+REQUIRED_PACKAGES = {
+    "langchain_openai": "langchain-openai",
+    "langgraph": "langgraph",
+    "langchain_core": "langchain-core",
+    "langchain_mcp_adapters": "langchain-mcp-adapters",
+}
+missing_packages = [
+    package for module, package in REQUIRED_PACKAGES.items()
+    if importlib.util.find_spec(module) is None
+]
+if missing_packages:
+    print(f"Please install the missing packages: pip install {' '.join(missing_packages)}")
     exit(1)
 
+# Standard LangChain imports
+from langchain_openai import ChatOpenAI
+from langgraph.prebuilt import create_react_agent
+from langchain_core.messages import HumanMessage
+
 # Standard MCP adapter imports
-try:
-    from langchain_mcp_adapters.client import MultiServerMCPClient
-except ImportError:
-    print("Please install MCP adapters: pip install langchain-mcp-adapters")
-    exit(1)
+from langchain_mcp_adapters.client import MultiServerMCPClient
+
+# Xero credentials, resolved once after .env has been loaded
+XERO_ENV_VARS = {
+    "XERO_CLIENT_ID": os.environ.get("XERO_CLIENT_ID"),
+    "XERO_CLIENT_SECRET": os.environ.get("XERO_CLIENT_SECRET"),
+}
+
+# Seconds to wait for each MCP server to start and list its tools when more
+# than one is configured. A single server is never timed out, since a cold
+# npx download of the Xero MCP server can take a while.
+MCP_STARTUP_TIMEOUT = float(os.environ.get("MCP_STARTUP_TIMEOUT", "120"))
+
+
+async def load_mcp_tools(client: MultiServerMCPClient) -> list:
+    """
+    Load tools from every configured MCP server concurrently.
+
+    With several servers, each gets its own startup timeout, so one slow or
+    broken server is reported and skipped instead of failing the whole agent.
+    """
+    server_names = list(client.connections)
+    timeout = MCP_STARTUP_TIMEOUT if len(server_names) > 1 else None
+    results = await asyncio.gather(
+        *(
+            asyncio.wait_for(client.get_tools(server_name=name), timeout=timeout)
+            for name in server_names
+        ),
+        return_exceptions=True,
+    )
+    
+    tools = []
+    errors = []
+    for name, result in zip(server_names, results):
+        if isinstance(result, BaseException):
+            print(f"⚠️ MCP server '{name}' failed to start: {result!r}")
+            errors.append(result)
+        else:
+            tools.extend(result)
+    
+    if not tools and errors:
+        raise errors[0]
+    return tools
 
 
 async def create_xero_mcp_agent():
@@ -42,15 +92,12 @@ async def create_xero_mcp_agent():
             "transport": "stdio",  # or "sse" for HTTP transport
             "command": "npx",
             "args": ["-y", "@xeroapi/xero-mcp-server@latest"],
-            "env": {
-                "XERO_CLIENT_ID": os.getenv("XERO_CLIENT_ID"),
-                "XERO_CLIENT_SECRET": os.getenv("XERO_CLIENT_SECRET"),
-            }
+            "env": XERO_ENV_VARS
         }
     })
     
     # Get tools automatically - no manual tool wrapping needed!
-    tools = await client.get_tools()
+    tools = await load_mcp_tools(client)
     
     # Create LLM - using GPT-4o for larger context window
     llm = ChatOpenAI(temperature=0, model="gpt-4o")
@@ -61,14 +108,12 @@ async def create_xero_mcp_agent():
     return agent, client
 
 
-async def demo_invoice_specialist_agent():
+async def demo_invoice_specialist_agent(agent):
     """Demonstrate an agent that specializes in invoice operations."""
     print("\n" + "="*50)
     print("INVOICE SPECIALIST AGENT")
     print("="*50)
     
-    agent, client = await create_xero_mcp_agent()
-    
     # Example queries - more focused and realistic
     queries = [
         "Find all draft invoices",
@@ -94,14 +139,12 @@ async def demo_invoice_specialist_agent():
         print(f"\n❌ Error: {e}")
 
 
-async def demo_contact_manager_agent():
+async def demo_contact_manager_agent(agent):
     """Demonstrate an agent that manages contacts."""
     print("\n" + "="*50)
     print("CONTACT MANAGER AGENT")
     print("="*50)
     
-    agent, client = await create_xero_mcp_agent()
-    
     # Example queries
     queries = [
         "Create a new customer called 'Demo Corp' with email demo@demo.com",
@@ -127,14 +170,12 @@ async def demo_contact_manager_agent():
         print(f"\n❌ Error: {e}")
 
 
-async def demo_multi_step_workflow():
+async def demo_multi_step_workflow(agent):
     """Demonstrate a multi-step workflow."""
     print("\n" + "="*50)
     print("MULTI-STEP WORKFLOW: MONTHLY INVOICING")
     print("="*50)
     
-    agent, client = await create_xero_mcp_agent()
-    
     workflow_prompt = """
     Please help me with monthly invoicing:
     1. First, find all active customers
@@ -157,14 +198,12 @@ async def demo_multi_step_workflow():
         print(f"\n❌ Error: {e}")
 
 
-async def demo_invoice_analysis():
+async def demo_invoice_analysis(agent):
     """Demonstrate invoice analysis."""
     print("\n" + "="*50)
     print("INVOICE ANALYSIS")
     print("="*50)
     
-    agent, client = await create_xero_mcp_agent()
-    
     analysis_prompt = """
     Please help me analyze my invoices:
     1. Find a recent invoice
@@ -187,7 +226,7 @@ async def demo_invoice_analysis():
         print(f"\n❌ Error: {e}")
 
 
-async def interactive_mcp_demo():
+async def interactive_mcp_demo(agent):
     """Run an interactive demo with the example agent."""
     print("\n" + "="*50)
     print("INTERACTIVE XERO AGENT")
@@ -195,8 +234,6 @@ async def interactive_mcp_demo():
     print("\nChat with your Xero agent. The agent has access to all Xero functions.")
     print("Type 'quit' to exit.\n")
     
-    agent, client = await create_xero_mcp_agent()
-    
     while True:
         try:
             user_input = input("\n👤 You: ").strip()
@@ -223,14 +260,12 @@ async def interactive_mcp_demo():
             print(f"\n❌ Error: {e}")
 
 
-async def demo_organization_insights():
+async def demo_organization_insights(agent):
     """Demonstrate getting organization insights."""
     print("\n" + "="*50)
     print("ORGANIZATION INSIGHTS")
     print("="*50)
     
-    agent, client = await create_xero_mcp_agent()
-    
     insights_prompt = """
     Please provide me with insights about my Xero organization:
     1. Get the organization details
@@ -254,6 +289,55 @@ async def demo_organization_insights():
         print(f"\n❌ Error: {e}")
 
 
+# Demos in menu order
+DEMOS = (
+    demo_invoice_specialist_agent,
+    demo_contact_manager_agent,
+    demo_multi_step_workflow,
+    demo_invoice_analysis,
+    interactive_mcp_demo,
+    demo_organization_insights,
+)
+
+
+async def run_demos():
+    """Let the user run demos one after another, sharing a single Xero agent."""
+    agent = None
+    while True:
+        print("Select a demo:")
+        print("1. Invoice Specialist Agent")
+        print("2. Contact Manager Agent")
+        print("3. Multi-step Workflow")
+        print("4. Invoice Analysis")
+        print("5. Interactive Chat")
+        print("6. Organization Insights")
+        
+        try:
+            choice = input("\nEnter your choice (1-6): ").strip()
+        except EOFError:
+            break
+        index = int(choice) - 1 if choice.isdecimal() else -1
+        
+        if 0 <= index < len(DEMOS):
+            try:
+                # Created on first use, then reused so later demos skip loading the MCP tools
+                if agent is None:
+                    agent, _ = await create_xero_mcp_agent()
+                await DEMOS[index](agent)
+            except Exception as e:
+                print(f"\n❌ Demo failed: {e}")
+                print("Please check your environment configuration and try again.")
+        else:
+            print("Invalid choice. Please select 1-6.")
+        
+        try:
+            again = input("\nRun another demo? (y/n): ").strip().lower()
+        except EOFError:
+            break
+        if again not in ("y", "yes"):
+            break
+        print()
+
 
 def main():
     """Run the MCP integration examples."""
@@ -263,7 +347,7 @@ def main():
         print("Error: OPENAI_API_KEY not set in environment")
         return
     
-    if not os.getenv("XERO_CLIENT_ID") or not os.getenv("XERO_CLIENT_SECRET"):
+    if not all(XERO_ENV_VARS.values()):
         print("Error: Xero credentials not set in environment")
         print("Please set XERO_CLIENT_ID and XERO_CLIENT_SECRET")
         return
@@ -271,29 +355,7 @@ def main():
     print("LangChain + Xero MCP Integration Examples")
     print("========================================\n")
     
-    print("Select a demo:")
-    print("1. Invoice Specialist Agent")
-    print("2. Contact Manager Agent")
-    print("3. Multi-step Workflow")
-    print("4. Invoice Analysis")
-    print("5. Interactive Chat")
-    print("6. Organization Insights")
-    
-    choice = input("\nEnter your choice (1-6): ").strip()
-    
-    demos = {
-        "1": demo_invoice_specialist_agent,
-        "2": demo_contact_manager_agent,
-        "3": demo_multi_step_workflow,
-        "4": demo_invoice_analysis,
-        "5": interactive_mcp_demo,
-        "6": demo_organization_insights
-    }
-    
-    if choice in demos:
-        asyncio.run(demos[choice]())
-    else:
-        print("Invalid choice. Please run again and select 1-6.")
+    asyncio.run(run_demos())
 
 
 if __name__ == "__main__":
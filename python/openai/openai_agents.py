@@ -7,98 +7,320 @@ with the OpenAI Agents SDK to create AI agents that can
 manage Xero accounting operations.
 """
 
+from __future__ import annotations
+
 import asyncio
+import contextlib
+import functools
 import os
+import re
 import shutil
-from dotenv import load_dotenv
-from typing import Optional
+import sys
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from agents import Agent
+    from agents.mcp import MCPServer
+
+# Launchers for the Xero MCP server, resolved once. The absolute paths also
+# spare the server process from searching PATH when it is started.
+NPX_PATH = shutil.which("npx")
+NODE_PATH = shutil.which("node")
+
+# Maximum number of agent runs in flight at once, to stay within OpenAI rate limits
+MAX_CONCURRENT_RUNS = 5
+
+# Usage notes shown when an interactive session starts
+INTERACTIVE_HELP = """
+Type your requests in natural language.
+Examples:
+- 'Create a new customer named ABC Corp with email info@abc.com'
+- 'Find all customers'
+- 'Find all draft invoices'
+- 'Find customers and show their contact IDs'
+
+⚠️  Important for creating invoices:
+- Contact IDs must be in UUID format (e.g., 12345678-1234-1234-1234-123456789abc)
+- Use 'Find customers' first to get valid contact IDs
+- Then use: 'Create invoice for contact ID [uuid] with item: Description for $Amount'
+
+Type 'quit' to exit.
+"""
+
+# Inputs that end an interactive session
+QUIT_COMMANDS = frozenset({"quit", "exit", "q"})
+
+# Demo banners and notes, each printed with a single call
+BANNER = "=" * 60
+BASIC_DEMO_HEADER = f"\n{BANNER}\nBASIC XERO AGENT DEMO\n{BANNER}"
+INVOICE_DEMO_HEADER = f"\n{BANNER}\nINVOICE SPECIALIST AGENT DEMO\n{BANNER}"
+CONTACT_DEMO_HEADER = f"\n{BANNER}\nCONTACT MANAGER AGENT DEMO\n{BANNER}"
+MULTI_AGENT_DEMO_HEADER = f"\n{BANNER}\nMULTI-AGENT WORKFLOW DEMO\n{BANNER}"
+COMPREHENSIVE_DEMO_HEADER = f"\n{BANNER}\nCOMPREHENSIVE WORKFLOW DEMO\n{BANNER}"
+INTERACTIVE_DEMO_HEADER = f"\n{BANNER}\nINTERACTIVE XERO AGENTS SDK DEMO\n{BANNER}"
+
+INVOICE_STEPS_NOTE = """
+💡 Note: To create an invoice, you would need to:
+    1. First get the contact_id from the customer creation response
+    2. Then create an invoice using that specific contact_id
+    3. Contact IDs in Xero are UUIDs, not simple strings like 'abc123'"""
+
+CONTACT_HANDOFF_NOTE = """
+💡 Note: In a real application, you would extract the contact ID
+    from the contact creation response and pass it to the invoice agent."""
+
+INVOICE_INSTRUCTIONS_NOTE = """
+💡 Instructions for creating an invoice:
+    1. Copy one of the contact IDs from above (the UUID format)
+    2. Use that ID to create an invoice like this:
+       'Create an invoice for contact ID [paste-uuid-here] with line item: Consulting for $1000'
+    3. The contact ID must be in UUID format like: 12345678-1234-1234-1234-123456789abc"""
+
+# A prompt is read-only if it starts with a read verb and uses no write verbs
+READ_ONLY_VERBS = frozenset({"find", "search", "list", "show", "get"})
+WRITE_VERBS = frozenset({
+    "create", "add", "update", "edit", "delete", "remove", "void",
+    "approve", "archive", "pay", "send", "email",
+})
 
-# Load environment variables
-load_dotenv()
+# Final outputs of read-only prompts, keyed on (agent name, normalized prompt)
+_response_cache: Dict[Tuple[str, str], Any] = {}
+# Bumped whenever a write starts or finishes. A read only caches its answer if
+# no write overlapped it, since Xero may have changed while it was running.
+_cache_generation = 0
 
-# Note: You'll need to install openai-agents separately
-# pip install openai-agents
-try:
-    from agents import Agent, Runner, gen_trace_id, trace
-    from agents.mcp import MCPServer, MCPServerStdio
-except ImportError:
-    print("Please install openai-agents: pip install openai-agents")
-    exit(1)
 
+# Agent instructions. OpenAI caches repeated prompt prefixes automatically, and
+# the instructions are sent first on every run, so keep these strings static:
+# never interpolate per-request data (names, dates, IDs) into them, or every
+# run becomes a cache miss. Dynamic context belongs in the run input.
+BASIC_AGENT_INSTRUCTIONS = """You are a helpful accounting assistant that manages Xero operations. 
+        You can create invoices, manage contacts, search for records, and handle various 
+        accounting tasks. Always confirm successful operations and provide relevant details 
+        to the user. Be precise with data handling and always verify important information."""
+
+INVOICE_SPECIALIST_INSTRUCTIONS = """You are an invoice specialist for Xero. You excel at creating, 
+        finding, and managing invoices. You understand accounting practices and can help 
+        with invoice workflows. Always provide invoice numbers and IDs when creating or 
+        finding invoices."""
+
+CONTACT_MANAGER_INSTRUCTIONS = """You are a contact management specialist for Xero. You help create, 
+        find, and update customer and supplier information. You understand the importance 
+        of accurate contact data for accounting and always validate important details."""
 
+
+@functools.lru_cache(maxsize=None)
 def create_basic_xero_agent(mcp_server: MCPServer) -> Agent:
     """
     Create a basic Xero agent with all tools.
     
+    Agents are cached per MCP server, so repeated calls return the same instance.
+    
     Args:
         mcp_server: The MCP server instance for Xero
     
     Returns:
         Configured Agent instance
     """
+    from agents import Agent
+    
     agent = Agent(
         name="Xero Assistant",
         model="gpt-4o-mini",
-        instructions="""You are a helpful accounting assistant that manages Xero operations. 
-        You can create invoices, manage contacts, search for records, and handle various 
-        accounting tasks. Always confirm successful operations and provide relevant details 
-        to the user. Be precise with data handling and always verify important information.""",
+        instructions=BASIC_AGENT_INSTRUCTIONS,
         mcp_servers=[mcp_server]
     )
     
     return agent
 
 
+@functools.lru_cache(maxsize=None)
 def create_invoice_specialist_agent(mcp_server: MCPServer) -> Agent:
     """
     Create an agent that specializes in invoice operations.
     
+    Agents are cached per MCP server, so repeated calls return the same instance.
+    
     Args:
         mcp_server: The MCP server instance for Xero
     
     Returns:
         Configured Agent instance for invoice operations
     """
+    from agents import Agent
+    
     agent = Agent(
         name="Invoice Specialist",
         model="gpt-4o-mini",
-        instructions="""You are an invoice specialist for Xero. You excel at creating, 
-        finding, and managing invoices. You understand accounting practices and can help 
-        with invoice workflows. Always provide invoice numbers and IDs when creating or 
-        finding invoices.""",
+        instructions=INVOICE_SPECIALIST_INSTRUCTIONS,
         mcp_servers=[mcp_server]
     )
     
     return agent
 
 
+@functools.lru_cache(maxsize=None)
 def create_contact_manager_agent(mcp_server: MCPServer) -> Agent:
     """
     Create an agent that specializes in contact management.
     
+    Agents are cached per MCP server, so repeated calls return the same instance.
+    
     Args:
         mcp_server: The MCP server instance for Xero
     
     Returns:
         Configured Agent instance for contact operations
     """
+    from agents import Agent
+    
     agent = Agent(
         name="Contact Manager",
         model="gpt-4o-mini",
-        instructions="""You are a contact management specialist for Xero. You help create, 
-        find, and update customer and supplier information. You understand the importance 
-        of accurate contact data for accounting and always validate important details.""",
+        instructions=CONTACT_MANAGER_INSTRUCTIONS,
         mcp_servers=[mcp_server]
     )
     
     return agent
 
 
+async def ainput(prompt: str) -> str:
+    """
+    Read a line from stdin in a background thread so the event loop keeps running.
+    
+    A daemon thread is used rather than the default executor, which would
+    block interpreter shutdown (e.g. after Ctrl+C) until Enter is pressed.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def resolve(setter, value):
+        if not future.done():
+            setter(value)
+    
+    def read():
+        try:
+            setter, value = future.set_result, input(prompt)
+        except BaseException as e:
+            setter, value = future.set_exception, e
+        try:
+            loop.call_soon_threadsafe(resolve, setter, value)
+        except RuntimeError:
+            pass  # The event loop has already closed
+    
+    threading.Thread(target=read, daemon=True).start()
+    return await future
+
+
+def agents_sdk_installed() -> bool:
+    """
+    Check that the Agents SDK can be imported.
+    
+    The SDK pulls in openai, httpx and pydantic, so the functions in this
+    module import it where they use it rather than when the module is loaded.
+    
+    Returns:
+        True if the SDK is installed, otherwise False
+    """
+    # Note: You'll need to install openai-agents separately
+    # pip install openai-agents
+    try:
+        import agents  # noqa: F401
+    except ImportError:
+        print("Please install openai-agents: pip install openai-agents")
+        return False
+    return True
+
+
+def is_readonly_prompt(prompt: str) -> bool:
+    """Return True if the prompt only reads Xero data and is safe to cache."""
+    words = re.findall(r"[a-z]+", prompt.lower())
+    return bool(words) and words[0] in READ_ONLY_VERBS and WRITE_VERBS.isdisjoint(words)
+
+
+async def cached_run(
+    agent: Agent,
+    prompt: str,
+    on_text_delta: Optional[Callable[[str], None]] = None,
+    cacheable: bool = True,
+) -> Any:
+    """
+    Run a prompt and return the agent's final output.
+    
+    Answers to read-only prompts are reused for the rest of the session.
+    Any other prompt may change data in Xero, so it clears the cache, and
+    reads that overlap it are not cached.
+    
+    Args:
+        agent: The agent to run the prompt with
+        prompt: The user's request
+        on_text_delta: If given, the run is streamed and this is called with
+            each chunk of text as the model produces it (not called when the
+            answer comes from the cache)
+        cacheable: Pass False for free-form prompts, such as the user's chat
+            input, which the verb check cannot reliably classify. They are
+            always run and treated as possible writes.
+    
+    Returns:
+        The agent's final output
+    """
+    from agents import Runner
+    
+    global _cache_generation
+    key = (agent.name, " ".join(prompt.lower().split()))
+    readonly = cacheable and is_readonly_prompt(prompt)
+    if readonly:
+        if key in _response_cache:
+            print("♻️  Reusing the earlier answer to this request")
+            return _response_cache[key]
+    else:
+        _cache_generation += 1
+        _response_cache.clear()
+    generation = _cache_generation
+    
+    try:
+        if on_text_delta is None:
+            result = await Runner.run(starting_agent=agent, input=prompt)
+        else:
+            result = Runner.run_streamed(starting_agent=agent, input=prompt)
+            async for event in result.stream_events():
+                if event.type == "raw_response_event" and event.data.type == "response.output_text.delta":
+                    on_text_delta(event.data.delta)
+    finally:
+        if not readonly:
+            # Reads that started while this write ran may have seen old data
+            _cache_generation += 1
+            _response_cache.clear()
+    
+    if readonly and generation == _cache_generation:
+        _response_cache[key] = result.final_output
+    return result.final_output
+
+
+async def run_requests_concurrently(agent: Agent, requests: List[str]) -> list:
+    """
+    Run independent requests against an agent at the same time.
+    
+    Args:
+        agent: The agent to run each request with
+        requests: Requests that do not depend on each other's results
+    
+    Returns:
+        One entry per request, in order: the final output or the exception raised
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_RUNS)
+    
+    async def run(request: str):
+        async with semaphore:
+            return await cached_run(agent, request)
+    
+    return await asyncio.gather(*(run(request) for request in requests), return_exceptions=True)
+
+
 async def demo_basic_agent(mcp_server: MCPServer):
     """Demonstrate the basic Xero agent capabilities."""
-    print("\n" + "="*60)
-    print("BASIC XERO AGENT DEMO")
-    print("="*60)
+    print(BASIC_DEMO_HEADER)
     
     agent = create_basic_xero_agent(mcp_server)
     
@@ -114,48 +336,42 @@ async def demo_basic_agent(mcp_server: MCPServer):
         print("💭 Agent thinking...")
         
         try:
-            result = await Runner.run(starting_agent=agent, input=request)
-            print(f"✅ Agent: {result.final_output}")
+            output = await cached_run(agent, request)
+            print(f"✅ Agent: {output}")
         except Exception as e:
             print(f"❌ Error: {e}")
     
-    print("\n💡 Note: To create an invoice, you would need to:")
-    print("    1. First get the contact_id from the customer creation response")
-    print("    2. Then create an invoice using that specific contact_id")
-    print("    3. Contact IDs in Xero are UUIDs, not simple strings like 'abc123'")
+    print(INVOICE_STEPS_NOTE)
 
 
 async def demo_invoice_specialist(mcp_server: MCPServer):
     """Demonstrate the invoice specialist agent."""
-    print("\n" + "="*60)
-    print("INVOICE SPECIALIST AGENT DEMO")
-    print("="*60)
+    print(INVOICE_DEMO_HEADER)
     
     agent = create_invoice_specialist_agent(mcp_server)
     
-    # Example invoice-specific requests
-    requests = [
-        "Find all draft invoices",
-        "Find all invoices with status AUTHORISED",
-        "Find invoices from the last 30 days"
-    ]
+    # The three lookups are independent, so ask for them in one request: the
+    # model can issue the tool calls in parallel within a single turn instead
+    # of paying for three separate round-trips
+    request = (
+        "Find (a) all draft invoices, (b) all invoices with status AUTHORISED, "
+        "and (c) invoices from the last 30 days. "
+        "Return the results as three sections labelled (a), (b) and (c)."
+    )
     
-    for request in requests:
-        print(f"\n📝 User: {request}")
-        print("💭 Agent thinking...")
-        
-        try:
-            result = await Runner.run(starting_agent=agent, input=request)
-            print(f"✅ Agent: {result.final_output}")
-        except Exception as e:
-            print(f"❌ Error: {e}")
+    print(f"\n📝 User: {request}")
+    print("💭 Agent thinking...")
+    
+    try:
+        output = await cached_run(agent, request)
+        print(f"✅ Agent: {output}")
+    except Exception as e:
+        print(f"❌ Error: {e}")
 
 
 async def demo_contact_manager(mcp_server: MCPServer):
     """Demonstrate the contact manager agent."""
-    print("\n" + "="*60)
-    print("CONTACT MANAGER AGENT DEMO")
-    print("="*60)
+    print(CONTACT_DEMO_HEADER)
     
     agent = create_contact_manager_agent(mcp_server)
     
@@ -166,50 +382,46 @@ async def demo_contact_manager(mcp_server: MCPServer):
         "Search for contacts with 'tech' in their name"
     ]
     
-    for request in requests:
+    # The requests are independent, so run them concurrently
+    print("\n💭 Agent thinking...")
+    results = await run_requests_concurrently(agent, requests)
+    
+    for request, result in zip(requests, results):
         print(f"\n👥 User: {request}")
-        print("💭 Agent thinking...")
-        
-        try:
-            result = await Runner.run(starting_agent=agent, input=request)
-            print(f"✅ Agent: {result.final_output}")
-        except Exception as e:
-            print(f"❌ Error: {e}")
+        if isinstance(result, BaseException):
+            print(f"❌ Error: {result}")
+        else:
+            print(f"✅ Agent: {result}")
 
 
 async def demo_multi_agent_workflow(mcp_server: MCPServer):
     """Demonstrate a workflow using multiple specialized agents."""
-    print("\n" + "="*60)
-    print("MULTI-AGENT WORKFLOW DEMO")
-    print("="*60)
+    print(MULTI_AGENT_DEMO_HEADER)
     
     contact_agent = create_contact_manager_agent(mcp_server)
     invoice_agent = create_invoice_specialist_agent(mcp_server)
     
     print("\n🔄 Step 1: Contact Manager creates a new customer")
     try:
-        result1 = await Runner.run(
-            starting_agent=contact_agent, 
-            input="Create a new customer named 'Demo Corp' with email billing@democorp.com"
+        output1 = await cached_run(
+            contact_agent,
+            "Create a new customer named 'Demo Corp' with email billing@democorp.com"
         )
-        print(f"✅ Contact Agent: {result1.final_output}")
+        print(f"✅ Contact Agent: {output1}")
         
-        print("\n🔄 Step 2: Find the customer we just created")
-        result2 = await Runner.run(
-            starting_agent=contact_agent,
-            input="Find a customer named 'Demo Corp'"
+        # Steps 2 and 3 only depend on step 1, so run them at the same time
+        output2, output3 = await asyncio.gather(
+            cached_run(contact_agent, "Find a customer named 'Demo Corp'"),
+            cached_run(contact_agent, "Find the first 3 customers"),
         )
-        print(f"✅ Contact Agent: {result2.final_output}")
+        
+        print("\n🔄 Step 2: Find the customer we just created")
+        print(f"✅ Contact Agent: {output2}")
         
         print("\n🔄 Step 3: Find existing customers to create an invoice for")
-        result3 = await Runner.run(
-            starting_agent=contact_agent,
-            input="Find the first 3 customers"
-        )
-        print(f"✅ Contact Agent: {result3.final_output}")
+        print(f"✅ Contact Agent: {output3}")
         
-        print("\n💡 Note: In a real application, you would extract the contact ID")
-        print("    from the contact creation response and pass it to the invoice agent.")
+        print(CONTACT_HANDOFF_NOTE)
         
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -217,9 +429,7 @@ async def demo_multi_agent_workflow(mcp_server: MCPServer):
 
 async def demo_comprehensive_workflow(mcp_server: MCPServer):
     """Demonstrate a comprehensive end-to-end workflow."""
-    print("\n" + "="*60)
-    print("COMPREHENSIVE WORKFLOW DEMO")
-    print("="*60)
+    print(COMPREHENSIVE_DEMO_HEADER)
     print("This demo shows how to properly work with contact IDs and create invoices")
     
     # Create a general agent that has all tools
@@ -227,31 +437,27 @@ async def demo_comprehensive_workflow(mcp_server: MCPServer):
     
     print("\n🔄 Step 1: Create a new customer")
     try:
-        result1 = await Runner.run(
-            starting_agent=agent, 
-            input="Create a new customer named 'Workflow Demo Ltd' with email demo@workflow.com"
+        output1 = await cached_run(
+            agent,
+            "Create a new customer named 'Workflow Demo Ltd' with email demo@workflow.com"
         )
-        print(f"✅ Agent: {result1.final_output}")
+        print(f"✅ Agent: {output1}")
         
         print("\n🔄 Step 2: Find customers to get a valid contact ID")
-        result2 = await Runner.run(
-            starting_agent=agent,
-            input="Find customers with 'Workflow' in their name and show me their contact IDs"
+        output2 = await cached_run(
+            agent,
+            "Find customers with 'Workflow' in their name and show me their contact IDs"
         )
-        print(f"✅ Agent: {result2.final_output}")
+        print(f"✅ Agent: {output2}")
         
         print("\n🔄 Step 3: Search for any existing customers we can use")
-        result3 = await Runner.run(
-            starting_agent=agent,
-            input="Find the first 3 customers and show their contact IDs so I can create an invoice"
+        output3 = await cached_run(
+            agent,
+            "Find the first 3 customers and show their contact IDs so I can create an invoice"
         )
-        print(f"✅ Agent: {result3.final_output}")
+        print(f"✅ Agent: {output3}")
         
-        print("\n💡 Instructions for creating an invoice:")
-        print("    1. Copy one of the contact IDs from above (the UUID format)")
-        print("    2. Use that ID to create an invoice like this:")
-        print("       'Create an invoice for contact ID [paste-uuid-here] with line item: Consulting for $1000'")
-        print("    3. The contact ID must be in UUID format like: 12345678-1234-1234-1234-123456789abc")
+        print(INVOICE_INSTRUCTIONS_NOTE)
         
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -259,15 +465,13 @@ async def demo_comprehensive_workflow(mcp_server: MCPServer):
 
 async def interactive_demo(mcp_server: MCPServer):
     """Run an interactive demo with the Agents SDK."""
-    print("\n" + "="*60)
-    print("INTERACTIVE XERO AGENTS SDK DEMO")
-    print("="*60)
+    print(INTERACTIVE_DEMO_HEADER)
     print("\nChoose an agent type:")
     print("1. General Xero Assistant (all tools)")
     print("2. Invoice Specialist")
     print("3. Contact Manager")
     
-    choice = input("\nEnter your choice (1-3): ").strip()
+    choice = (await ainput("\nEnter your choice (1-3): ")).strip()
     
     if choice == "1":
         agent = create_basic_xero_agent(mcp_server)
@@ -283,34 +487,56 @@ async def interactive_demo(mcp_server: MCPServer):
         return
     
     print(f"\n🤖 {agent_name} is ready!")
-    print("\nType your requests in natural language.")
-    print("Examples:")
-    print("- 'Create a new customer named ABC Corp with email info@abc.com'")
-    print("- 'Find all customers'")
-    print("- 'Find all draft invoices'")
-    print("- 'Find customers and show their contact IDs'")
-    print("\n⚠️  Important for creating invoices:")
-    print("- Contact IDs must be in UUID format (e.g., 12345678-1234-1234-1234-123456789abc)")
-    print("- Use 'Find customers' first to get valid contact IDs")
-    print("- Then use: 'Create invoice for contact ID [uuid] with item: Description for $Amount'")
-    print("\nType 'quit' to exit.\n")
+    print(INTERACTIVE_HELP)
+    
+    # Reading ahead relies on plain input(). A line editor such as readline
+    # would redraw its own empty prompt over the "You: " printed later, so
+    # if one is loaded, wait for each reply and prompt as usual instead.
+    read_ahead = "readline" not in sys.modules
     
+    next_input = None
     while True:
         try:
-            user_input = input("\nYou: ").strip()
-            
-            if user_input.lower() in ['quit', 'exit', 'q']:
-                print("\nGoodbye!")
-                break
+            if next_input is None:
+                next_input = asyncio.ensure_future(ainput("\nYou: "))
+            else:
+                # The next line is read ahead without a prompt so it cannot
+                # interleave with the streamed reply; show the prompt now
+                print("\nYou: ", end="", flush=True)
+                if next_input.done() and next_input.exception() is None:
+                    print(next_input.result())
+            user_input = (await next_input).strip()
+            next_input = None
             
             if not user_input:
                 continue
             
+            if user_input.lower() in QUIT_COMMANDS:
+                print("\nGoodbye!")
+                break
+            
             print("💭 Agent thinking...")
-            result = await Runner.run(starting_agent=agent, input=user_input)
-            print(f"\n🤖 {agent_name}: {result.final_output}")
+            streamed = False
+            
+            def show(delta: str):
+                # Print the reply as it streams in rather than all at the end
+                nonlocal streamed
+                if not streamed:
+                    print(f"\n🤖 {agent_name}: ", end="")
+                    streamed = True
+                print(delta, end="", flush=True)
             
-        except KeyboardInterrupt:
+            # Let the user type their next request while the agent works on this one
+            run = asyncio.ensure_future(cached_run(agent, user_input, on_text_delta=show, cacheable=False))
+            if read_ahead:
+                next_input = asyncio.ensure_future(ainput(""))
+            output = await run
+            if streamed:
+                print()
+            else:
+                print(f"\n🤖 {agent_name}: {output}")
+            
+        except (KeyboardInterrupt, EOFError):
             print("\n\nGoodbye!")
             break
         except Exception as e:
@@ -330,7 +556,7 @@ async def run_demo_with_mcp(mcp_server: MCPServer):
     print("5. Comprehensive Workflow (Recommended)")
     print("6. Interactive Agent")
     
-    choice = input("\nEnter your choice (1-6): ").strip()
+    choice = (await ainput("\nEnter your choice (1-6): ")).strip()
     
     if choice == "1":
         await demo_basic_agent(mcp_server)
@@ -345,43 +571,93 @@ async def run_demo_with_mcp(mcp_server: MCPServer):
     elif choice == "6":
         await interactive_demo(mcp_server)
     else:
-        print("Invalid choice. Please run again and select 1-6.")
+        print("Invalid choice. Please select 1-6.")
 
 
 async def main():
     """Run the OpenAI Agents SDK integration examples."""
+    # Load environment variables
+    from dotenv import load_dotenv
+    load_dotenv()
+    
+    # Snapshot the settings once; they are reused for the MCP server below
+    env = os.environ
+    openai_key = env.get("OPENAI_API_KEY")
+    client_id = env.get("XERO_CLIENT_ID")
+    client_secret = env.get("XERO_CLIENT_SECRET")
+    server_path = env.get("XERO_MCP_SERVER_PATH")
+    # Same switch the Agents SDK uses to stop exporting traces
+    tracing_disabled = env.get("OPENAI_AGENTS_DISABLE_TRACING", "").lower() in ("true", "1")
+    
     # Check for required environment variables
-    if not os.getenv("OPENAI_API_KEY"):
+    if not openai_key:
         print("Error: OPENAI_API_KEY not set in environment")
         print("Please set your OpenAI API key to run this example")
         return
     
-    if not os.getenv("XERO_CLIENT_ID") or not os.getenv("XERO_CLIENT_SECRET"):
+    if not client_id or not client_secret:
         print("Error: Xero credentials not set in environment")
         print("Please set XERO_CLIENT_ID and XERO_CLIENT_SECRET")
         return
     
-    # Check if npx is available
-    if not shutil.which("npx"):
-        raise RuntimeError("npx is not installed. Please install it with `npm install -g npx`.")
+    if not agents_sdk_installed():
+        sys.exit(1)
+    from agents import gen_trace_id, trace
+    from agents.mcp import MCPServerStdio
+    
+    # Prefer a locally installed Xero MCP server, which starts without npx
+    # resolving and downloading the package from the npm registry first
+    if server_path:
+        if NODE_PATH is None:
+            raise RuntimeError("node is not installed. Please install Node.js from https://nodejs.org/.")
+        command, args = NODE_PATH, [server_path]
+    else:
+        # Check if npx is available
+        if NPX_PATH is None:
+            raise RuntimeError("npx is not installed. Please install it with `npm install -g npx`.")
+        command, args = NPX_PATH, ["-y", "@xeroapi/xero-mcp-server@latest"]
     
-    # Initialize MCP server and run demos
+    # Initialize MCP server and run demos. The tool list is cached so each
+    # agent run reuses it instead of asking the server to list tools again.
     async with MCPServerStdio(
         name="Xero",
+        cache_tools_list=True,
         params={
-            "command": "npx",
-            "args": ["-y", "@xeroapi/xero-mcp-server@latest"],
+            "command": command,
+            "args": args,
             "env": {
-                "XERO_CLIENT_ID": os.environ['XERO_CLIENT_ID'],
-                "XERO_CLIENT_SECRET": os.environ['XERO_CLIENT_SECRET']
+                "XERO_CLIENT_ID": client_id,
+                "XERO_CLIENT_SECRET": client_secret
             }
         }
     ) as server:
-        trace_id = gen_trace_id()
-        with trace(workflow_name="Xero MCP Example", trace_id=trace_id):
+        if tracing_disabled:
+            tracing = contextlib.nullcontext()
+        else:
+            trace_id = gen_trace_id()
+            tracing = trace(workflow_name="Xero MCP Example", trace_id=trace_id)
             print(f"View trace: https://platform.openai.com/traces/{trace_id}\n")
-            await run_demo_with_mcp(server)
+        with tracing:
+            # Keep the MCP server running so further demos skip its startup
+            while True:
+                await run_demo_with_mcp(server)
+                try:
+                    again = (await ainput("\nRun another demo? (y/n): ")).strip().lower()
+                except EOFError:
+                    break
+                if again not in ("y", "yes"):
+                    break
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    # uvloop speeds up the stdio and HTTPS traffic when it is installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        if sys.version_info >= (3, 12):
+            asyncio.run(main(), loop_factory=uvloop.new_event_loop)
+        else:
+            uvloop.install()
+            asyncio.run(main()) 
\ No newline at end of file